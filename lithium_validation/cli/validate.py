@@ -4,6 +4,7 @@ Command-line interface for Lithium-Validation framework.
 """
 
 import argparse
+import itertools
 import sys
 import json
 from typing import Optional
@@ -49,12 +50,35 @@ Examples:
                        help="Confidence threshold for validation (0.0-1.0)")
     
     args = parser.parse_args()
-    
+
+    # Configure validator
+    config = {"confidence_threshold": args.threshold}
+    interface = ValidationInterface(config)
+
     # Get text to validate
+    text = None
     if args.file:
         try:
-            with open(args.file, 'r', encoding='utf-8') as f:
-                text = f.read().strip()
+            if interface.validator.supports_streaming():
+                # Feed the file through the streaming scanner in 64 KiB
+                # blocks so peak memory stays constant regardless of size
+                with open(args.file, 'r', encoding='utf-8') as f:
+                    # Skip whitespace-only leading blocks so an empty
+                    # file reaches the shared "no text" error below
+                    # instead of scoring, matching the non-streaming path
+                    first = f.read(65536)
+                    while first and not first.strip():
+                        first = f.read(65536)
+                    if first:
+                        chunks = itertools.chain(
+                            [first], iter(lambda: f.read(65536), ''))
+                        result = interface.validator.validate_stream(
+                            chunks, args.type)
+                        print_result(result, args)
+                        return
+            else:
+                with open(args.file, 'r', encoding='utf-8') as f:
+                    text = f.read().strip()
         except FileNotFoundError:
             print(f"Error: File '{args.file}' not found", file=sys.stderr)
             sys.exit(1)
@@ -63,33 +87,32 @@ Examples:
             sys.exit(1)
     else:
         text = args.text
-    
+
     if not text:
         print("Error: No text provided for validation", file=sys.stderr)
         sys.exit(1)
-    
-    # Configure validator
-    config = {"confidence_threshold": args.threshold}
-    interface = ValidationInterface(config)
-    
+
     # Perform validation
     try:
         result = interface.validate_output(text, args.context, args.type)
-        
-        if args.quiet:
-            print("true" if result.is_valid else "false")
-            sys.exit(0 if result.is_valid else 1)
-        
-        if args.json:
-            print(json.dumps(result.to_dict(), indent=2))
-        else:
-            print_validation_result(result, args.type)
-            
+        print_result(result, args)
     except Exception as e:
         print(f"Error during validation: {e}", file=sys.stderr)
         sys.exit(1)
 
 
+def print_result(result, args):
+    """Render a validation result according to the output flags."""
+    if args.quiet:
+        print("true" if result.is_valid else "false")
+        sys.exit(0 if result.is_valid else 1)
+
+    if args.json:
+        print(json.dumps(result.to_dict(), indent=2))
+    else:
+        print_validation_result(result, args.type)
+
+
 def print_validation_result(result, validation_type: str):
     """Print validation result in human-readable format."""
     print("🔬 Lithium-Validation Results")
@@ -98,7 +121,7 @@ def print_validation_result(result, validation_type: str):
     print(f"✅ Valid: {'Yes' if result.is_valid else 'No'}")
     print(f"🎯 Confidence: {result.confidence.value.upper()}")
     print(f"📊 Score: {result.score:.2f}")
-    print(f"⏰ Timestamp: {result.timestamp.strftime('%Y-%m-%d %H:%M:%S')}")
+    print(f"⏰ Timestamp: {result.timestamp.isoformat(' ', 'seconds')}")
     
     if result.details:
         print("\n📈 Detailed Analysis:")
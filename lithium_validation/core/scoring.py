@@ -0,0 +1,39 @@
+"""
+Scalar scoring kernel for the validation engine.
+
+Kept free of optional imports and dynamic rebinding so it passes mypy
+and can be compiled ahead of time with mypyc (see setup.py,
+LITHIUM_AOT=1). The engine JIT-compiles it with numba instead when that
+is installed and the kernel is still pure Python.
+"""
+
+
+def score(factual_hits: int, uncertainty_hits: int, contradiction_hits: int,
+          has_citations: bool, short_cite_count: int,
+          has_transitions: bool) -> tuple:
+    """
+    Numeric scoring reduction shared by the validators.
+
+    Takes the hit counts produced by the pattern matchers and returns
+    (factual, logical, source, total) scores, each clamped to [0, 1].
+    """
+    factual = 1.0 - 0.2 * factual_hits
+    uncertainty_bonus = 0.1 * uncertainty_hits
+    if uncertainty_bonus > 0.3:
+        uncertainty_bonus = 0.3
+    factual += uncertainty_bonus
+    factual = max(0.0, min(1.0, factual))
+
+    logical = 1.0 - 0.3 * contradiction_hits
+    if has_transitions:
+        logical += 0.1
+    logical = max(0.0, min(1.0, logical))
+
+    source = 1.0
+    if not has_citations:
+        source -= 0.4
+    source -= 0.1 * short_cite_count
+    source = max(0.0, min(1.0, source))
+
+    total = 0.4 * factual + 0.3 * logical + 0.3 * source
+    return factual, logical, source, total
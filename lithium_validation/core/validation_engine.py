@@ -8,8 +8,124 @@ from typing import Dict, List, Optional, Any
 from dataclasses import dataclass
 import json
 import re
+import threading
+import time
 from datetime import datetime
 
+from .scoring import score as _score
+
+try:
+    import hyperscan
+except ImportError:
+    # Optional accelerated matcher; the pure-re path is used when absent.
+    hyperscan = None
+
+try:
+    import ahocorasick
+except ImportError:
+    # Optional multi-string matcher for the pure-literal word sets.
+    ahocorasick = None
+
+try:
+    from numba import njit
+except ImportError:
+    njit = None
+
+try:
+    import numpy as np
+except ImportError:
+    # Optional; batch scoring falls back to the scalar path without it.
+    np = None
+
+
+# JIT the scoring kernel when numba is available and the kernel is
+# still pure Python; a mypyc-compiled scoring module has no bytecode
+# for numba to translate and is already fast
+if njit is not None and hasattr(_score, "__code__"):
+    _score = njit(cache=True)(_score)
+
+_TRANSITION_WORDS = ["however", "therefore", "moreover", "furthermore", "additionally"]
+
+# Pattern-ID layout for the fused Hyperscan database
+_HS_FACTUAL_BASE = 0
+_HS_UNCERTAINTY_BASE = 100
+_HS_CITATION_BASE = 200
+_HS_CONTRADICTION_BASE = 300
+# Streaming-only patterns: transitions and short citations are handled in
+# Python for block scans but need database patterns when the text is
+# never held in memory
+_HS_TRANSITION_BASE = 400
+_HS_SHORT_CITATION = 500
+
+# Chunk size for streaming validation
+_STREAM_BLOCK_SIZE = 65536
+
+# Validation rules and patterns; fixed for the life of the process
+_VALIDATION_RULES = {
+    "factual_patterns": [
+        r"according to [^,]+,",
+        r"studies show",
+        r"research indicates",
+        r"data suggests",
+        r"statistics show"
+    ],
+    "uncertainty_indicators": [
+        r"might be",
+        r"could be",
+        r"possibly",
+        r"perhaps",
+        r"it seems",
+        r"appears to"
+    ],
+    "citation_patterns": [
+        r"\[[\d\w\s,]+\]",
+        r"\([^)]*20\d{2}[^)]*\)",
+        r"source:",
+        r"reference:",
+        r"according to"
+    ]
+}
+
+_CONTRADICTIONS = [
+    ("always", "never"),
+    ("all", "none"),
+    ("every", "no"),
+    ("completely", "partially")
+]
+
+# Fuse each category into a single alternation compiled once at import,
+# so every validator instance shares the same pattern objects and the
+# engine scans the output once per category instead of once per pattern.
+# The fused patterns are lowercase literals matched against text the
+# caller has already lowercased, so IGNORECASE is unnecessary.
+_FACTUAL_GROUPS = [f"f{i}" for i in range(len(_VALIDATION_RULES["factual_patterns"]))]
+_FACTUAL_RE = re.compile(
+    "|".join(f"(?P<f{i}>{p})"
+             for i, p in enumerate(_VALIDATION_RULES["factual_patterns"]))
+)
+_UNCERTAINTY_RE = re.compile(
+    "|".join(f"(?:{p})" for p in _VALIDATION_RULES["uncertainty_indicators"])
+)
+_CITATION_RE = re.compile(
+    "|".join(f"(?:{p})" for p in _VALIDATION_RULES["citation_patterns"])
+)
+# Each contradiction word owns one bit; a pair fires when both of its
+# bits are set in the scan mask
+_CONTRADICTION_BIT = {
+    f"c{i}": 1 << i for i in range(2 * len(_CONTRADICTIONS))
+}
+_CONTRADICTION_PAIR_MASKS = [
+    ((1 << (2 * i)) | (1 << (2 * i + 1)), pos, neg)
+    for i, (pos, neg) in enumerate(_CONTRADICTIONS)
+]
+_CONTRADICTION_RE = re.compile(
+    "|".join(
+        rf"(?P<c{2 * i}>\b{pos}\b)|(?P<c{2 * i + 1}>\b{neg}\b)"
+        for i, (pos, neg) in enumerate(_CONTRADICTIONS)
+    )
+)
+_INCOMPLETE_CITATION = re.compile(r"\[[^\]]*\]")
+
 
 class ConfidenceLevel(Enum):
     """Confidence levels for validation results."""
@@ -19,7 +135,14 @@ class ConfidenceLevel(Enum):
     INSUFFICIENT = "insufficient"  # <50% confidence
 
 
-@dataclass
+# Cached members so the hot path avoids enum value lookups
+_HIGH = ConfidenceLevel.HIGH
+_MEDIUM = ConfidenceLevel.MEDIUM
+_LOW = ConfidenceLevel.LOW
+_INSUFFICIENT = ConfidenceLevel.INSUFFICIENT
+
+
+@dataclass(slots=True)
 class ValidationResult:
     """Result of a validation operation."""
     is_valid: bool
@@ -27,9 +150,14 @@ class ValidationResult:
     score: float  # 0.0 to 1.0
     details: Dict[str, Any]
     warnings: List[str]
-    timestamp: datetime
+    timestamp_epoch: float
     validation_type: str
-    
+
+    @property
+    def timestamp(self) -> datetime:
+        """Validation time, materialized lazily from the stored epoch."""
+        return datetime.fromtimestamp(self.timestamp_epoch)
+
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary for serialization."""
         return {
@@ -42,6 +170,19 @@ class ValidationResult:
             "validation_type": self.validation_type
         }
 
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "ValidationResult":
+        """Rebuild a result from its to_dict form."""
+        return cls(
+            is_valid=data["is_valid"],
+            confidence=ConfidenceLevel(data["confidence"]),
+            score=data["score"],
+            details=data["details"],
+            warnings=data["warnings"],
+            timestamp_epoch=datetime.fromisoformat(data["timestamp"]).timestamp(),
+            validation_type=data["validation_type"]
+        )
+
 
 class OutputValidator:
     """
@@ -54,8 +195,132 @@ class OutputValidator:
     def __init__(self, config: Optional[Dict[str, Any]] = None):
         """Initialize the validator with optional configuration."""
         self.config = config or self._default_config()
+        # Hoist per-call config lookups into typed attributes; configure()
+        # rebuilds the validator, so these never go stale
+        self._enable_factual = bool(self.config.get("enable_factual_validation", True))
+        self._enable_logical = bool(self.config.get("enable_logical_consistency", True))
+        self._enable_sources = bool(self.config.get("enable_source_attribution", True))
+        self._threshold = float(self.config.get("confidence_threshold", 0.7))
+        self._max_warnings = int(self.config.get("max_warnings", 10))
         self.validation_rules = self._load_validation_rules()
-    
+        # Alias the module-level compiled patterns; compilation happens
+        # once at import rather than per validator instance
+        contradictions = _CONTRADICTIONS
+        self._factual_groups = _FACTUAL_GROUPS
+        self._factual_re = _FACTUAL_RE
+        self._uncertainty_re = _UNCERTAINTY_RE
+        self._citation_re = _CITATION_RE
+        self._contradiction_bit = _CONTRADICTION_BIT
+        self._contradiction_pair_masks = _CONTRADICTION_PAIR_MASKS
+        self._contradiction_re = _CONTRADICTION_RE
+        self._incomplete_citation = _INCOMPLETE_CITATION
+        self._contradictions = contradictions
+        self._hs_db = self._build_hyperscan_db(contradictions)
+        self._hs_stream_db = None  # built lazily on first validate_stream
+        self._hs_last_scan = None
+        # Hyperscan block scans share one scratch space per database,
+        # which the bindings do not make thread-safe; serialize them
+        self._hs_scan_lock = threading.Lock()
+        # Aho-Corasick automata for the pure-literal word sets: one O(N)
+        # pass over the lowercased text finds every hit at once
+        self._ac_uncertainty = self._build_automaton(
+            (literal, literal)
+            for literal in self.validation_rules["uncertainty_indicators"]
+        )
+        self._ac_contradiction = self._build_automaton(
+            (word, f"c{i}")
+            for i, word in enumerate(
+                word for pair in contradictions for word in pair)
+        )
+        self._ac_transitions = self._build_automaton(
+            (word, word) for word in _TRANSITION_WORDS
+        )
+
+    @staticmethod
+    def _build_automaton(words):
+        """Build an Aho-Corasick automaton over (word, payload) pairs."""
+        if ahocorasick is None:
+            return None
+        automaton = ahocorasick.Automaton()
+        for word, payload in words:
+            automaton.add_word(word, (word, payload))
+        automaton.make_automaton()
+        return automaton
+
+    @staticmethod
+    def _iter_word_hits(automaton, text: str):
+        """Yield automaton payloads whose hits fall on word boundaries."""
+        for end, (word, payload) in automaton.iter(text):
+            start = end - len(word) + 1
+            if start > 0 and (text[start - 1].isalnum() or text[start - 1] == "_"):
+                continue
+            if end + 1 < len(text) and (text[end + 1].isalnum() or text[end + 1] == "_"):
+                continue
+            yield payload
+
+    def _build_hyperscan_db(self, contradictions, streaming: bool = False):
+        """Compile all patterns into one Hyperscan database if available."""
+        if hyperscan is None:
+            return None
+        expressions = []
+        ids = []
+        flags = []
+        for i, pattern in enumerate(self.validation_rules["factual_patterns"]):
+            expressions.append(pattern.encode())
+            ids.append(_HS_FACTUAL_BASE + i)
+            if streaming:
+                # No SOM in stream mode; the matched text is gone anyway
+                flags.append(hyperscan.HS_FLAG_CASELESS)
+            else:
+                # Need start-of-match offsets to report the matched claim text
+                flags.append(hyperscan.HS_FLAG_CASELESS | hyperscan.HS_FLAG_SOM_LEFTMOST)
+        for i, pattern in enumerate(self.validation_rules["uncertainty_indicators"]):
+            expressions.append(pattern.encode())
+            ids.append(_HS_UNCERTAINTY_BASE + i)
+            flags.append(hyperscan.HS_FLAG_CASELESS)
+        for i, pattern in enumerate(self.validation_rules["citation_patterns"]):
+            expressions.append(pattern.encode())
+            ids.append(_HS_CITATION_BASE + i)
+            flags.append(hyperscan.HS_FLAG_CASELESS | hyperscan.HS_FLAG_SINGLEMATCH)
+        for i, word in enumerate(
+                word for pair in contradictions for word in pair):
+            expressions.append(rf"\b{word}\b".encode())
+            ids.append(_HS_CONTRADICTION_BASE + i)
+            flags.append(hyperscan.HS_FLAG_CASELESS | hyperscan.HS_FLAG_SINGLEMATCH)
+        if streaming:
+            for i, word in enumerate(_TRANSITION_WORDS):
+                expressions.append(word.encode())
+                ids.append(_HS_TRANSITION_BASE + i)
+                flags.append(hyperscan.HS_FLAG_CASELESS | hyperscan.HS_FLAG_SINGLEMATCH)
+            # Citations shorter than five characters, brackets included
+            expressions.append(rb"\[[^\]]{0,2}\]")
+            ids.append(_HS_SHORT_CITATION)
+            flags.append(hyperscan.HS_FLAG_CASELESS)
+        try:
+            db = hyperscan.Database(
+                mode=hyperscan.HS_MODE_STREAM if streaming else hyperscan.HS_MODE_BLOCK)
+            db.compile(expressions=expressions, ids=ids, flags=flags)
+            return db
+        except hyperscan.error:
+            return None
+
+    def _hs_buckets(self, output: str) -> Dict[int, List[tuple]]:
+        """Scan the output once and bucket (start, end) hits by pattern ID."""
+        # Bind the memo locally: validators are shared across worker
+        # threads, so reading the attribute twice could mix up outputs
+        last = self._hs_last_scan
+        if last is not None and last[0] == output:
+            return last[1]
+        buckets: Dict[int, List[tuple]] = {}
+
+        def on_match(pattern_id, start, end, match_flags, context=None):
+            buckets.setdefault(pattern_id, []).append((start, end))
+
+        with self._hs_scan_lock:
+            self._hs_db.scan(output.encode("utf-8"), match_event_handler=on_match)
+        self._hs_last_scan = (output, buckets)
+        return buckets
+
     def _default_config(self) -> Dict[str, Any]:
         """Default configuration for the validator."""
         return {
@@ -68,30 +333,7 @@ class OutputValidator:
     
     def _load_validation_rules(self) -> Dict[str, Any]:
         """Load validation rules and patterns."""
-        return {
-            "factual_patterns": [
-                r"according to [^,]+,",
-                r"studies show",
-                r"research indicates",
-                r"data suggests",
-                r"statistics show"
-            ],
-            "uncertainty_indicators": [
-                r"might be",
-                r"could be",
-                r"possibly",
-                r"perhaps",
-                r"it seems",
-                r"appears to"
-            ],
-            "citation_patterns": [
-                r"\[[\d\w\s,]+\]",
-                r"\([^)]*20\d{2}[^)]*\)",
-                r"source:",
-                r"reference:",
-                r"according to"
-            ]
-        }
+        return _VALIDATION_RULES
     
     def validate(self, output: str, context: Optional[str] = None, 
                 validation_type: str = "comprehensive") -> ValidationResult:
@@ -109,144 +351,434 @@ class OutputValidator:
         warnings = []
         details = {}
         score = 0.0
-        
+        weight_total = 0.0
+        run_factual, run_logical, run_sources = self._enabled_checks(validation_type)
+        # Lowercase once; every matcher works on case-normalized text
+        lo = output.lower()
+
         # Factual validation
-        if self.config.get("enable_factual_validation", True):
-            factual_score, factual_warnings = self._validate_factual_claims(output)
+        if run_factual:
+            factual_hits, factual_warnings = self._count_factual(lo)
+            factual_score = _score(
+                factual_hits, self._count_uncertainty(lo), 0, True, 0, False)[0]
             score += factual_score * 0.4
+            weight_total += 0.4
             warnings.extend(factual_warnings)
             details["factual_validation"] = {
                 "score": factual_score,
                 "warnings": len(factual_warnings)
             }
-        
+
         # Logical consistency
-        if self.config.get("enable_logical_consistency", True):
-            logical_score, logical_warnings = self._validate_logical_consistency(output)
+        if run_logical:
+            contradiction_hits, logical_warnings = self._count_contradictions(lo)
+            logical_score = _score(
+                0, 0, contradiction_hits, True, 0, self._has_transitions(lo))[1]
             score += logical_score * 0.3
+            weight_total += 0.3
             warnings.extend(logical_warnings)
             details["logical_consistency"] = {
                 "score": logical_score,
                 "warnings": len(logical_warnings)
             }
-        
+
         # Source attribution
-        if self.config.get("enable_source_attribution", True):
-            source_score, source_warnings = self._validate_source_attribution(output)
+        if run_sources:
+            has_citations, short_cites, source_warnings = self._count_citations(lo)
+            source_score = _score(0, 0, 0, has_citations, short_cites, False)[2]
             score += source_score * 0.3
+            weight_total += 0.3
             warnings.extend(source_warnings)
             details["source_attribution"] = {
                 "score": source_score,
                 "warnings": len(source_warnings)
             }
-        
+
+        if weight_total:
+            score /= weight_total
+
         # Determine confidence level
         confidence = self._determine_confidence(score)
         
         # Check if valid based on threshold
-        is_valid = score >= self.config.get("confidence_threshold", 0.7)
-        
-        # Limit warnings
-        max_warnings = self.config.get("max_warnings", 10)
-        if len(warnings) > max_warnings:
-            warnings = warnings[:max_warnings]
-            warnings.append(f"... and {len(warnings) - max_warnings} more warnings")
+        is_valid = score >= self._threshold
         
+        warnings = self._cap_warnings(warnings)
+
         return ValidationResult(
             is_valid=is_valid,
             confidence=confidence,
             score=score,
             details=details,
             warnings=warnings,
-            timestamp=datetime.now(),
+            timestamp_epoch=time.time(),
             validation_type=validation_type
         )
-    
+
+    def supports_streaming(self) -> bool:
+        """Whether constant-memory streaming validation is available."""
+        return hyperscan is not None and self._hs_db is not None
+
+    def validate_stream(self, chunks,
+                        validation_type: str = "comprehensive") -> ValidationResult:
+        """
+        Validate text supplied as an iterable of chunks in constant memory.
+
+        Requires hyperscan streaming support. The text is never held in
+        full, so warnings reference the matching pattern instead of the
+        matched text.
+        """
+        if not self.supports_streaming():
+            raise RuntimeError(
+                "Streaming validation requires the hyperscan package")
+        if self._hs_stream_db is None:
+            self._hs_stream_db = self._build_hyperscan_db(
+                self._contradictions, streaming=True)
+            if self._hs_stream_db is None:
+                raise RuntimeError("Failed to build streaming pattern database")
+
+        counts: Dict[int, int] = {}
+
+        def on_match(pattern_id, start, end, match_flags, context=None):
+            counts[pattern_id] = counts.get(pattern_id, 0) + 1
+
+        terminators = 0
+        with self._hs_stream_db.stream(match_event_handler=on_match) as stream:
+            for chunk in chunks:
+                data = chunk.encode("utf-8") if isinstance(chunk, str) else chunk
+                terminators += data.count(b".") + data.count(b"!") + data.count(b"?")
+                stream.scan(data)
+
+        warnings = []
+        details = {}
+        score = 0.0
+        weight_total = 0.0
+        run_factual, run_logical, run_sources = self._enabled_checks(validation_type)
+
+        if run_factual:
+            factual_warnings = [
+                f"Unsupported factual claim detected: pattern '{pattern}'"
+                for i, pattern in enumerate(self.validation_rules["factual_patterns"])
+                if counts.get(_HS_FACTUAL_BASE + i)
+            ]
+            uncertainty_count = sum(
+                counts.get(_HS_UNCERTAINTY_BASE + i, 0)
+                for i in range(len(self.validation_rules["uncertainty_indicators"]))
+            )
+            factual_score = _score(
+                len(factual_warnings), uncertainty_count, 0, True, 0, False)[0]
+            score += factual_score * 0.4
+            weight_total += 0.4
+            warnings.extend(factual_warnings)
+            details["factual_validation"] = {
+                "score": factual_score,
+                "warnings": len(factual_warnings)
+            }
+
+        if run_logical:
+            mask = 0
+            for pattern_id in counts:
+                if _HS_CONTRADICTION_BASE <= pattern_id < _HS_TRANSITION_BASE:
+                    mask |= 1 << (pattern_id - _HS_CONTRADICTION_BASE)
+            logical_warnings = [
+                f"Potential contradiction detected: {pos} vs {neg}"
+                for pair_mask, pos, neg in self._contradiction_pair_masks
+                if mask & pair_mask == pair_mask
+            ]
+            has_transitions = terminators > 0 and any(
+                counts.get(_HS_TRANSITION_BASE + i)
+                for i in range(len(_TRANSITION_WORDS))
+            )
+            logical_score = _score(
+                0, 0, len(logical_warnings), True, 0, has_transitions)[1]
+            score += logical_score * 0.3
+            weight_total += 0.3
+            warnings.extend(logical_warnings)
+            details["logical_consistency"] = {
+                "score": logical_score,
+                "warnings": len(logical_warnings)
+            }
+
+        if run_sources:
+            has_citations = any(
+                _HS_CITATION_BASE <= pattern_id < _HS_CONTRADICTION_BASE
+                for pattern_id in counts
+            )
+            short_cites = counts.get(_HS_SHORT_CITATION, 0) if has_citations else 0
+            source_warnings = []
+            if not has_citations:
+                source_warnings.append("No citations or source attributions found")
+            else:
+                source_warnings.extend(
+                    ["Incomplete citation detected"] * short_cites)
+            source_score = _score(0, 0, 0, has_citations, short_cites, False)[2]
+            score += source_score * 0.3
+            weight_total += 0.3
+            warnings.extend(source_warnings)
+            details["source_attribution"] = {
+                "score": source_score,
+                "warnings": len(source_warnings)
+            }
+
+        if weight_total:
+            score /= weight_total
+
+        return ValidationResult(
+            is_valid=score >= self._threshold,
+            confidence=self._determine_confidence(score),
+            score=score,
+            details=details,
+            warnings=self._cap_warnings(warnings),
+            timestamp_epoch=time.time(),
+            validation_type=validation_type
+        )
+
+    def _enabled_checks(self, validation_type: str) -> tuple[bool, bool, bool]:
+        """
+        Resolve which validators a validation type runs.
+
+        "comprehensive" runs everything enabled in the config; the
+        focused types run their single check; "quick" skips the
+        contradiction scan and only checks claims and citations.
+        """
+        run_factual = self._enable_factual \
+            and validation_type in ("comprehensive", "factual", "quick")
+        run_logical = self._enable_logical \
+            and validation_type in ("comprehensive", "logical")
+        run_sources = self._enable_sources \
+            and validation_type in ("comprehensive", "sources", "quick")
+        return run_factual, run_logical, run_sources
+
+    def validate_batch(self, outputs: List[str],
+                       validation_type: str = "comprehensive") -> List[ValidationResult]:
+        """
+        Validate many outputs, scoring them in one vectorized pass.
+
+        The pattern matchers run per output to collect an (N, 6) count
+        matrix; the scoring arithmetic is then applied to whole columns
+        with NumPy. Falls back to per-output validation when NumPy is
+        not installed.
+        """
+        if np is None:
+            return [self.validate(output, validation_type=validation_type)
+                    for output in outputs]
+
+        enable_factual, enable_logical, enable_sources = \
+            self._enabled_checks(validation_type)
+
+        counts = np.zeros((len(outputs), 6), dtype=np.float64)
+        warnings_per_output = []
+        for i, output in enumerate(outputs):
+            row_warnings = []
+            lo = output.lower()
+            if enable_factual:
+                factual_hits, factual_warnings = self._count_factual(lo)
+                counts[i, 0] = factual_hits
+                counts[i, 1] = self._count_uncertainty(lo)
+                row_warnings.append(factual_warnings)
+            if enable_logical:
+                contradiction_hits, logical_warnings = self._count_contradictions(lo)
+                counts[i, 2] = contradiction_hits
+                counts[i, 5] = self._has_transitions(lo)
+                row_warnings.append(logical_warnings)
+            if enable_sources:
+                has_citations, short_cites, source_warnings = self._count_citations(lo)
+                counts[i, 3] = has_citations
+                counts[i, 4] = short_cites
+                row_warnings.append(source_warnings)
+            warnings_per_output.append(row_warnings)
+
+        factual = np.clip(
+            1.0 - 0.2 * counts[:, 0] + np.minimum(0.1 * counts[:, 1], 0.3), 0.0, 1.0)
+        logical = np.clip(1.0 - 0.3 * counts[:, 2] + 0.1 * counts[:, 5], 0.0, 1.0)
+        source = np.clip(1.0 - 0.4 * (1.0 - counts[:, 3]) - 0.1 * counts[:, 4], 0.0, 1.0)
+        total = (0.4 * factual * enable_factual
+                 + 0.3 * logical * enable_logical
+                 + 0.3 * source * enable_sources)
+        weight_total = (0.4 * enable_factual + 0.3 * enable_logical
+                        + 0.3 * enable_sources)
+        if weight_total:
+            total /= weight_total
+
+        now = time.time()
+        results = []
+        for i, output in enumerate(outputs):
+            details = {}
+            warnings = []
+            row = iter(warnings_per_output[i])
+            if enable_factual:
+                category_warnings = next(row)
+                warnings.extend(category_warnings)
+                details["factual_validation"] = {
+                    "score": float(factual[i]),
+                    "warnings": len(category_warnings)
+                }
+            if enable_logical:
+                category_warnings = next(row)
+                warnings.extend(category_warnings)
+                details["logical_consistency"] = {
+                    "score": float(logical[i]),
+                    "warnings": len(category_warnings)
+                }
+            if enable_sources:
+                category_warnings = next(row)
+                warnings.extend(category_warnings)
+                details["source_attribution"] = {
+                    "score": float(source[i]),
+                    "warnings": len(category_warnings)
+                }
+            score = float(total[i])
+            results.append(ValidationResult(
+                is_valid=score >= self._threshold,
+                confidence=self._determine_confidence(score),
+                score=score,
+                details=details,
+                warnings=self._cap_warnings(warnings),
+                timestamp_epoch=now,
+                validation_type=validation_type
+            ))
+        return results
+
+    def _cap_warnings(self, warnings: List[str]) -> List[str]:
+        """Limit warnings to the configured maximum."""
+        max_warnings = self._max_warnings
+        overflow = len(warnings) - max_warnings
+        if overflow > 0:
+            # Truncate in place rather than copying the survivors
+            del warnings[max_warnings:]
+            warnings.append(f"... and {overflow} more warnings")
+        return warnings
+
+    def _count_factual(self, lo: str) -> tuple[int, List[str]]:
+        """Count unsupported factual claim hits and build their warnings.
+
+        Expects pre-lowercased text.
+        """
+        warnings = []
+
+        if self._hs_db is not None:
+            buckets = self._hs_buckets(lo)
+            data = lo.encode("utf-8")
+            for i in range(len(self._factual_groups)):
+                spans = buckets.get(_HS_FACTUAL_BASE + i)
+                if spans:
+                    start, end = min(spans)
+                    claim = data[start:end].decode("utf-8", errors="replace")
+                    warnings.append(f"Unsupported factual claim detected: {claim}")
+        else:
+            # Check for unsupported factual claims in a single fused scan,
+            # bucketing hits by which alternation branch matched
+            first_hits: Dict[str, str] = {}
+            for match in self._factual_re.finditer(lo):
+                first_hits.setdefault(match.lastgroup, match.group())
+            for group in self._factual_groups:
+                if group in first_hits:
+                    warnings.append(f"Unsupported factual claim detected: {first_hits[group]}")
+        return len(warnings), warnings
+
+    def _count_uncertainty(self, lo: str) -> int:
+        """Count uncertainty indicator hits (a good sign) in lowercased text."""
+        if self._ac_uncertainty is not None:
+            # The indicators are plain literals; no boundary filtering, to
+            # match the unanchored regex patterns
+            uncertainty_count = sum(1 for _ in self._ac_uncertainty.iter(lo))
+        elif self._hs_db is not None:
+            uncertainty_count = sum(
+                len(self._hs_buckets(lo).get(_HS_UNCERTAINTY_BASE + i, ()))
+                for i in range(len(self.validation_rules["uncertainty_indicators"]))
+            )
+        else:
+            uncertainty_count = sum(1 for _ in self._uncertainty_re.finditer(lo))
+        return uncertainty_count
+
     def _validate_factual_claims(self, output: str) -> tuple[float, List[str]]:
         """Validate factual claims in the output."""
+        lo = output.lower()
+        factual_hits, warnings = self._count_factual(lo)
+        uncertainty_count = self._count_uncertainty(lo)
+        factual, _, _, _ = _score(factual_hits, uncertainty_count, 0, True, 0, False)
+        return factual, warnings
+
+    def _count_contradictions(self, lo: str) -> tuple[int, List[str]]:
+        """Count contradictory word pairs in lowercased text."""
         warnings = []
-        score = 1.0
-        
-        # Check for unsupported factual claims
-        factual_patterns = self.validation_rules["factual_patterns"]
-        for pattern in factual_patterns:
-            matches = re.findall(pattern, output, re.IGNORECASE)
-            if matches:
-                warnings.append(f"Unsupported factual claim detected: {matches[0]}")
-                score -= 0.2
-        
-        # Check for uncertainty indicators (good sign)
-        uncertainty_patterns = self.validation_rules["uncertainty_indicators"]
-        uncertainty_count = 0
-        for pattern in uncertainty_patterns:
-            uncertainty_count += len(re.findall(pattern, output, re.IGNORECASE))
-        
-        if uncertainty_count > 0:
-            score += min(uncertainty_count * 0.1, 0.3)
-        
-        return max(0.0, min(1.0, score)), warnings
-    
+
+        # Check for contradictory statements with one pass over the text,
+        # OR-ing a bit per matched word into a single mask
+        mask = 0
+        if self._ac_contradiction is not None:
+            for group in self._iter_word_hits(self._ac_contradiction, lo):
+                mask |= self._contradiction_bit[group]
+        elif self._hs_db is not None:
+            for pattern_id in self._hs_buckets(lo):
+                if pattern_id >= _HS_CONTRADICTION_BASE:
+                    mask |= 1 << (pattern_id - _HS_CONTRADICTION_BASE)
+        else:
+            for match in self._contradiction_re.finditer(lo):
+                mask |= self._contradiction_bit[match.lastgroup]
+        for pair_mask, pos, neg in self._contradiction_pair_masks:
+            if mask & pair_mask == pair_mask:
+                warnings.append(f"Potential contradiction detected: {pos} vs {neg}")
+        return len(warnings), warnings
+
+    def _has_transitions(self, lo: str) -> bool:
+        """Check logical flow: transition words in multi-sentence text."""
+        # Counting terminator characters avoids building a throwaway list
+        # of sentence strings; each str.count is a C-level scan
+        sentence_terminators = lo.count('.') + lo.count('!') + lo.count('?')
+        if sentence_terminators == 0:
+            return False
+        # Simple coherence check
+        if self._ac_transitions is not None:
+            return next(self._ac_transitions.iter(lo), None) is not None
+        return any(word in lo for word in _TRANSITION_WORDS)
+
     def _validate_logical_consistency(self, output: str) -> tuple[float, List[str]]:
         """Validate logical consistency of the output."""
+        lo = output.lower()
+        contradiction_hits, warnings = self._count_contradictions(lo)
+        has_transitions = self._has_transitions(lo)
+        _, logical, _, _ = _score(0, 0, contradiction_hits, True, 0, has_transitions)
+        return logical, warnings
+
+    def _count_citations(self, lo: str) -> tuple[bool, int, List[str]]:
+        """Check citation presence and short citations in lowercased text."""
         warnings = []
-        score = 1.0
-        
-        # Check for contradictory statements
-        contradictions = [
-            ("always", "never"),
-            ("all", "none"),
-            ("every", "no"),
-            ("completely", "partially")
-        ]
-        
-        for pos, neg in contradictions:
-            if re.search(rf"\b{pos}\b", output, re.IGNORECASE) and \
-               re.search(rf"\b{neg}\b", output, re.IGNORECASE):
-                warnings.append(f"Potential contradiction detected: {pos} vs {neg}")
-                score -= 0.3
-        
-        # Check for logical flow
-        sentences = re.split(r'[.!?]+', output)
-        if len(sentences) > 1:
-            # Simple coherence check
-            transition_words = ["however", "therefore", "moreover", "furthermore", "additionally"]
-            has_transitions = any(word in output.lower() for word in transition_words)
-            if has_transitions:
-                score += 0.1
-        
-        return max(0.0, min(1.0, score)), warnings
-    
-    def _validate_source_attribution(self, output: str) -> tuple[float, List[str]]:
-        """Validate source attribution and citations."""
-        warnings = []
-        score = 1.0
-        
-        citation_patterns = self.validation_rules["citation_patterns"]
-        has_citations = any(re.search(pattern, output, re.IGNORECASE) 
-                           for pattern in citation_patterns)
-        
+
+        if self._hs_db is not None:
+            buckets = self._hs_buckets(lo)
+            has_citations = any(
+                _HS_CITATION_BASE <= pattern_id < _HS_CONTRADICTION_BASE
+                for pattern_id in buckets
+            )
+        else:
+            has_citations = self._citation_re.search(lo) is not None
+
+        short_cite_count = 0
         if not has_citations:
             warnings.append("No citations or source attributions found")
-            score -= 0.4
-        
-        # Check for proper citation format
-        if has_citations:
+        else:
             # Look for incomplete citations
-            incomplete_citations = re.findall(r"\[[^\]]*\]", output)
+            incomplete_citations = self._incomplete_citation.findall(lo)
             for citation in incomplete_citations:
                 if len(citation) < 5:  # Very short citations
                     warnings.append(f"Incomplete citation: {citation}")
-                    score -= 0.1
-        
-        return max(0.0, min(1.0, score)), warnings
+                    short_cite_count += 1
+        return has_citations, short_cite_count, warnings
+
+    def _validate_source_attribution(self, output: str) -> tuple[float, List[str]]:
+        """Validate source attribution and citations."""
+        has_citations, short_cite_count, warnings = self._count_citations(output.lower())
+        _, _, source, _ = _score(0, 0, 0, has_citations, short_cite_count, False)
+        return source, warnings
     
     def _determine_confidence(self, score: float) -> ConfidenceLevel:
         """Determine confidence level based on score."""
         if score >= 0.9:
-            return ConfidenceLevel.HIGH
+            return _HIGH
         elif score >= 0.7:
-            return ConfidenceLevel.MEDIUM
+            return _MEDIUM
         elif score >= 0.5:
-            return ConfidenceLevel.LOW
+            return _LOW
         else:
-            return ConfidenceLevel.INSUFFICIENT
+            return _INSUFFICIENT
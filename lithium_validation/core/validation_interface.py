@@ -3,9 +3,44 @@ High-level validation interface for Lithium-Validation framework.
 Provides easy-to-use functions for common validation tasks.
 """
 
-from typing import Optional, Dict, Any, Union
+import concurrent.futures
+import functools
+import os
+import threading
+from collections import OrderedDict
+from typing import Iterable, Iterator, Optional, Dict, Any, Union
 from .validation_engine import OutputValidator, ValidationResult, ConfidenceLevel
 
+try:
+    import numpy as np
+    from sentence_transformers import SentenceTransformer
+except ImportError:
+    # Optional semantic-cache dependencies; exact-match caching still works.
+    np = None
+    SentenceTransformer = None
+
+_CACHE_MAX_ENTRIES = 1024
+_SEMANTIC_MODEL = "all-MiniLM-L6-v2"
+_SEMANTIC_THRESHOLD = 0.87
+
+# Batches at or below this size are validated serially; spawning worker
+# processes costs more than it saves for small inputs.
+_MIN_PARALLEL_BATCH = 32
+
+# Per-process validator reused across _validate_one calls in a worker
+_worker_validator: Optional[OutputValidator] = None
+_worker_config: Optional[Dict[str, Any]] = None
+
+
+def _validate_one(args) -> ValidationResult:
+    """Validate a single output in a worker process (must be picklable)."""
+    global _worker_validator, _worker_config
+    output, validation_type, config = args
+    if _worker_validator is None or _worker_config != config:
+        _worker_validator = OutputValidator(dict(config) if config else None)
+        _worker_config = config
+    return _worker_validator.validate(output, validation_type=validation_type)
+
 
 class ValidationInterface:
     """
@@ -25,7 +60,59 @@ class ValidationInterface:
             "enable_source_attribution": True,
             "max_warnings": 10
         }
-    
+        self._cache: OrderedDict = OrderedDict()
+        # The MCP server fans validate_output calls across worker
+        # threads, so every cache mutation happens under this lock
+        self._cache_lock = threading.Lock()
+        self._semantic = bool(self.validator.config.get("semantic_cache", False)) \
+            and SentenceTransformer is not None
+        self._embedder = None
+        # Ring buffer of cached embeddings, capped like the exact-match
+        # cache; _sem_next wraps and overwrites the oldest entry
+        self._sem_vectors = None  # (_CACHE_MAX_ENTRIES, dim) matrix
+        self._sem_results: list = []
+        self._sem_next = 0
+
+    def _clear_cache(self) -> None:
+        """Drop all cached validation results."""
+        with self._cache_lock:
+            self._cache.clear()
+            self._sem_vectors = None
+            self._sem_results = []
+            self._sem_next = 0
+
+    def _semantic_lookup(self, output: str):
+        """Return a cached result for a semantically similar output, if any."""
+        if self._embedder is None:
+            self._embedder = SentenceTransformer(_SEMANTIC_MODEL)
+        query = self._embedder.encode(output, normalize_embeddings=True)
+        # Embedding runs unlocked; only the matrix scoring needs the lock
+        with self._cache_lock:
+            if self._sem_results:
+                similarities = self._sem_vectors[:len(self._sem_results)] @ query
+                best = int(np.argmax(similarities))
+                if similarities[best] > _SEMANTIC_THRESHOLD:
+                    return self._sem_results[best], query
+        return None, query
+
+    def _semantic_store(self, vector, result: ValidationResult) -> None:
+        """Record an embedding and its result for future similarity hits.
+
+        The store is a fixed-size ring: once full, new entries overwrite
+        the oldest slot instead of growing the matrix.
+        """
+        with self._cache_lock:
+            if self._sem_vectors is None:
+                self._sem_vectors = np.empty(
+                    (_CACHE_MAX_ENTRIES, len(vector)), dtype=vector.dtype)
+            slot = self._sem_next % _CACHE_MAX_ENTRIES
+            self._sem_vectors[slot] = vector
+            if slot < len(self._sem_results):
+                self._sem_results[slot] = result
+            else:
+                self._sem_results.append(result)
+            self._sem_next += 1
+
     def validate_output(self, output: str, context: Optional[str] = None, 
                       validation_type: str = "comprehensive") -> ValidationResult:
         """
@@ -44,7 +131,27 @@ class ValidationInterface:
         Returns:
             ValidationResult object with validation details
         """
-        return self.validator.validate(output, context, validation_type)
+        key = (hash(output), context, validation_type)
+        with self._cache_lock:
+            cached = self._cache.get(key)
+            if cached is not None:
+                self._cache.move_to_end(key)
+                return cached
+
+        query_vector = None
+        if self._semantic and validation_type == "comprehensive":
+            hit, query_vector = self._semantic_lookup(output)
+            if hit is not None:
+                return hit
+
+        result = self.validator.validate(output, context, validation_type)
+        with self._cache_lock:
+            self._cache[key] = result
+            if len(self._cache) > _CACHE_MAX_ENTRIES:
+                self._cache.popitem(last=False)
+        if query_vector is not None:
+            self._semantic_store(query_vector, result)
+        return result
     
     def quick_check(self, output: str) -> bool:
         """
@@ -104,12 +211,45 @@ class ValidationInterface:
         Returns:
             List of ValidationResult objects
         """
+        if len(outputs) > _MIN_PARALLEL_BATCH:
+            cpu = os.cpu_count() or 1
+            chunksize = max(1, len(outputs) // (4 * cpu))
+            with concurrent.futures.ProcessPoolExecutor(max_workers=cpu) as executor:
+                return list(executor.map(
+                    _validate_one,
+                    ((output, validation_type, self.validator.config)
+                     for output in outputs),
+                    chunksize=chunksize
+                ))
+
+        if np is not None and len(outputs) > 1:
+            return self.validator.validate_batch(outputs, validation_type)
+
         results = []
         for output in outputs:
             result = self.validate_output(output, validation_type=validation_type)
             results.append(result)
         return results
-    
+
+    def iter_validate(self, outputs: Iterable[str],
+                      validation_type: str = "comprehensive") -> Iterator[ValidationResult]:
+        """
+        Validate outputs lazily, yielding each result as it is ready.
+
+        Unlike batch_validate, the first result is available after one
+        validation rather than after the whole batch, so callers can
+        render or transmit results incrementally.
+
+        Args:
+            outputs: Iterable of AI-generated contents to validate
+            validation_type: Type of validation to perform
+
+        Yields:
+            ValidationResult objects, one per output, in input order
+        """
+        for output in outputs:
+            yield self.validate_output(output, validation_type=validation_type)
+
     def configure(self, **kwargs) -> None:
         """
         Update validation configuration.
@@ -119,6 +259,14 @@ class ValidationInterface:
         """
         self._default_config.update(kwargs)
         self.validator = OutputValidator(self._default_config)
+        self._clear_cache()
+
+
+@functools.lru_cache(maxsize=None)
+def _get_interface(config_items: Optional[frozenset] = None) -> ValidationInterface:
+    """Return a shared ValidationInterface, built once per configuration."""
+    config = dict(config_items) if config_items else None
+    return ValidationInterface(config)
 
 
 # Convenience functions for quick access
@@ -132,8 +280,7 @@ def quick_check(output: str) -> bool:
     Returns:
         True if output passes validation, False otherwise
     """
-    interface = ValidationInterface()
-    return interface.quick_check(output)
+    return _get_interface().quick_check(output)
 
 
 def quick_validate(output: str, context: Optional[str] = None) -> ValidationResult:
@@ -147,8 +294,7 @@ def quick_validate(output: str, context: Optional[str] = None) -> ValidationResu
     Returns:
         ValidationResult object with validation details
     """
-    interface = ValidationInterface()
-    return interface.validate_output(output, context, "quick")
+    return _get_interface().validate_output(output, context, "quick")
 
 
 def comprehensive_validate(output: str, context: Optional[str] = None) -> ValidationResult:
@@ -162,8 +308,7 @@ def comprehensive_validate(output: str, context: Optional[str] = None) -> Valida
     Returns:
         ValidationResult object with validation details
     """
-    interface = ValidationInterface()
-    return interface.validate_output(output, context, "comprehensive")
+    return _get_interface().validate_output(output, context, "comprehensive")
 
 
 def get_confidence_level(score: float) -> str:
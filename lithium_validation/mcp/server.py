@@ -4,27 +4,96 @@ MCP (Model Context Protocol) server for Lithium-Validation framework.
 Uses low-level MCP server API to avoid decorator issues.
 """
 
+from __future__ import annotations
+
 import asyncio
+import bisect
+import functools
+import hashlib
+import inspect
 import json
+import os
+import time
+from collections import OrderedDict
+from pathlib import Path
 from typing import Any, Dict, List, Optional
 from datetime import datetime
 
 try:
-    from mcp.server.lowlevel import Server
-    from mcp.server.stdio import stdio_server
-    from mcp.server.models import InitializationOptions
-    from mcp.types import (
-        CallToolRequest,
-        CallToolResult,
-        ListToolsRequest,
-        ListToolsResult,
-        Tool,
-        TextContent,
-        ImageContent
-    )
+    import diskcache
+except ImportError:
+    # Optional; comprehensive results are only cached in memory without it.
+    diskcache = None
+
+# Bumped whenever scoring changes so stale disk entries never resurface
+_CACHE_VERSION = "1.0.0"
+
+# The MCP stack is imported lazily so `from lithium_validation.mcp.server
+# import LithiumMCPServer` stays cheap for CLI cold start and test
+# collection; _import_mcp() populates these on first server construction.
+anyio = None
+Server = None
+stdio_server = None
+InitializationOptions = None
+CallToolRequest = None
+CallToolResult = None
+ListToolsRequest = None
+ListToolsResult = None
+Tool = None
+TextContent = None
+ImageContent = None
+
+
+def _import_mcp() -> None:
+    """Import the MCP stack into module globals on first use."""
+    global anyio, Server, stdio_server, InitializationOptions
+    global CallToolRequest, CallToolResult, ListToolsRequest, ListToolsResult
+    global Tool, TextContent, ImageContent
+    if Server is not None:
+        return
+    try:
+        import anyio as _anyio
+        from mcp.server.lowlevel import Server as _Server
+        from mcp.server.stdio import stdio_server as _stdio_server
+        from mcp.server.models import InitializationOptions as _InitializationOptions
+        from mcp.types import (
+            CallToolRequest as _CallToolRequest,
+            CallToolResult as _CallToolResult,
+            ListToolsRequest as _ListToolsRequest,
+            ListToolsResult as _ListToolsResult,
+            Tool as _Tool,
+            TextContent as _TextContent,
+            ImageContent as _ImageContent,
+        )
+    except ImportError:
+        print("MCP not installed. Install with: pip install mcp")
+        raise
+    anyio = _anyio
+    Server = _Server
+    stdio_server = _stdio_server
+    InitializationOptions = _InitializationOptions
+    CallToolRequest = _CallToolRequest
+    CallToolResult = _CallToolResult
+    ListToolsRequest = _ListToolsRequest
+    ListToolsResult = _ListToolsResult
+    Tool = _Tool
+    TextContent = _TextContent
+    ImageContent = _ImageContent
+
+
+try:
+    import msgspec
+
+    _json_encoder = msgspec.json.Encoder()
+
+    def _json_encode(obj: Any) -> str:
+        return _json_encoder.encode(obj).decode()
 except ImportError:
-    print("MCP not installed. Install with: pip install mcp")
-    raise
+    # The stdlib encoder is the fallback when msgspec is not installed.
+    msgspec = None
+
+    def _json_encode(obj: Any) -> str:
+        return json.dumps(obj)
 
 try:
     from ..core.validation_interface import ValidationInterface, ValidationResult
@@ -36,117 +105,254 @@ except ImportError:
     from lithium_validation.core.validation_interface import ValidationInterface, ValidationResult
 
 
+# Static fragments shared by every formatted response; building them
+# once keeps the multi-byte emoji literals out of the per-call f-strings
+# (TextContent requires str, so the transport UTF-8 encodes exactly once)
+_HEADER_SINGLE = "🔬 Lithium-Validation Results\n" + "=" * 40 + "\n"
+_HEADER_BATCH = "🔬 Batch Validation Results\n" + "=" * 40 + "\n\n"
+_VALID_YES = "✅ Valid: Yes\n"
+_VALID_NO = "✅ Valid: No\n"
+_ITEM_VALID_YES = "  ✅ Valid: Yes\n"
+_ITEM_VALID_NO = "  ✅ Valid: No\n"
+_DETAILS_HEADER = "\n📈 Detailed Analysis:\n"
+_NO_WARNINGS = "\n✅ No warnings found\n"
+
+# Confidence thresholds, sorted for bisect
+_CONFIDENCE_BOUNDS = (0.5, 0.7, 0.9)
+_CONFIDENCE_LABELS = ("INSUFFICIENT", "LOW", "MEDIUM", "HIGH")
+
+
+@functools.lru_cache(maxsize=64)
+def _pretty(category: str) -> str:
+    """Display label for a details category; the set is small and fixed."""
+    return category.replace('_', ' ').title()
+
+
+class _TTLCache:
+    """Minimal LRU cache with per-entry TTL expiry.
+
+    Covers the get/set operations the server needs without adding a
+    hard dependency on cachetools.
+    """
+
+    def __init__(self, maxsize: int, ttl: float):
+        self._maxsize = maxsize
+        self._ttl = ttl
+        self._entries: "OrderedDict[Any, Any]" = OrderedDict()
+
+    def get(self, key: Any) -> Any:
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        value, expires = entry
+        if time.monotonic() >= expires:
+            del self._entries[key]
+            return None
+        self._entries.move_to_end(key)
+        return value
+
+    def set(self, key: Any, value: Any) -> None:
+        self._entries[key] = (value, time.monotonic() + self._ttl)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self._maxsize:
+            self._entries.popitem(last=False)
+
+
 class LithiumMCPServer:
     """MCP server for Lithium-Validation framework."""
-    
+
     def __init__(self, config: Optional[Dict[str, Any]] = None):
         """Initialize the MCP server."""
+        _import_mcp()
         self.server = Server("lithium-validation")
-        self.validator = ValidationInterface(config)
+        self._config = config
+        # Bounds how many batch items run concurrently on worker threads
+        self._semaphore = asyncio.Semaphore(
+            (config or {}).get("max_concurrency", 8))
+        # Bounds concurrent tool invocations; created lazily because the
+        # limiter needs a running event loop
+        self._max_inflight = (config or {}).get("max_inflight", 32)
+        self._limiter = None
+        # Repeat requests for the same output skip the validator entirely
+        self._cache = _TTLCache(
+            maxsize=4096, ttl=(config or {}).get("cache_ttl", 300))
+        # Comprehensive validations additionally persist to disk so
+        # restarts keep the heavy results
+        self._dcache = None
+        if diskcache is not None:
+            cache_dir = Path(
+                (config or {}).get("cache_dir", "~/.cache/lithium_validation")
+            ).expanduser()
+            self._dcache = diskcache.Cache(str(cache_dir))
+        # The tool list never changes, so build it once and reuse it
+        self._tools_result = self._build_tools_result()
+        # Shared rejection results for empty inputs; the handlers never
+        # mutate them, so one instance each serves every bad request
+        self._empty_output_err = CallToolResult(
+            content=[TextContent(type="text", text="Error: No output provided")],
+            isError=True
+        )
+        self._empty_batch_err = CallToolResult(
+            content=[TextContent(type="text", text="Error: No outputs provided")],
+            isError=True
+        )
         self._setup_handlers()
+
+    @functools.cached_property
+    def validator(self) -> ValidationInterface:
+        """Validation interface, constructed on first use."""
+        return ValidationInterface(self._config)
+
+    @staticmethod
+    def _cache_key(name: str, validation_type: Optional[str],
+                   output: str, context: Optional[str] = None) -> tuple:
+        """Build a compact cache key for a tool invocation."""
+        digest = hashlib.blake2b(output.encode(), digest_size=16).digest()
+        return (name, validation_type, context, digest)
+
+    @staticmethod
+    def _disk_key(validation_type: str, context: Optional[str],
+                  output: str) -> str:
+        """Versioned key for the persistent cache."""
+        return hashlib.blake2b(
+            f"{_CACHE_VERSION}|{validation_type}|{context}|{output}".encode(),
+            digest_size=24).hexdigest()
+
+    @staticmethod
+    async def _invoke(fn, *args, **kwargs):
+        """Await coroutine validators directly; offload sync ones to a thread.
+
+        Keeps the event loop responsive under concurrent call_tool
+        requests regardless of which validator implementation is plugged
+        in.
+        """
+        if inspect.iscoroutinefunction(fn):
+            return await fn(*args, **kwargs)
+        return await asyncio.to_thread(fn, *args, **kwargs)
     
-    def _setup_handlers(self):
-        """Set up MCP request handlers using low-level API."""
-        
-        async def handle_list_tools(request: ListToolsRequest) -> ListToolsResult:
-            """List available validation tools."""
-            return ListToolsResult(
-                tools=[
-                    Tool(
-                        name="validate_output",
-                        description="Validate AI-generated output for accuracy and reliability",
-                        inputSchema={
-                            "type": "object",
-                            "properties": {
-                                "output": {
-                                    "type": "string",
-                                    "description": "The AI-generated content to validate"
-                                },
-                                "context": {
-                                    "type": "string",
-                                    "description": "Additional context for validation (optional)"
-                                },
-                                "validation_type": {
-                                    "type": "string",
-                                    "enum": ["quick", "comprehensive", "factual", "logical", "sources"],
-                                    "default": "comprehensive",
-                                    "description": "Type of validation to perform"
-                                }
+    @staticmethod
+    def _build_tools_result() -> ListToolsResult:
+        """Build the immutable tool catalogue served to clients."""
+        return ListToolsResult(
+            tools=[
+                Tool(
+                    name="validate_output",
+                    description="Validate AI-generated output for accuracy and reliability",
+                    inputSchema={
+                        "type": "object",
+                        "properties": {
+                            "output": {
+                                "type": "string",
+                                "description": "The AI-generated content to validate"
                             },
-                            "required": ["output"]
-                        }
-                    ),
-                    Tool(
-                        name="quick_check",
-                        description="Quick validation check - returns true/false",
-                        inputSchema={
-                            "type": "object",
-                            "properties": {
-                                "output": {
-                                    "type": "string",
-                                    "description": "The AI-generated content to check"
-                                }
+                            "context": {
+                                "type": "string",
+                                "description": "Additional context for validation (optional)"
                             },
-                            "required": ["output"]
-                        }
-                    ),
-                    Tool(
-                        name="get_confidence_score",
-                        description="Get confidence score for an output (0.0 to 1.0)",
-                        inputSchema={
-                            "type": "object",
-                            "properties": {
-                                "output": {
-                                    "type": "string",
-                                    "description": "The AI-generated content to score"
-                                }
+                            "validation_type": {
+                                "type": "string",
+                                "enum": ["quick", "comprehensive", "factual", "logical", "sources"],
+                                "default": "comprehensive",
+                                "description": "Type of validation to perform"
                             },
-                            "required": ["output"]
-                        }
-                    ),
-                    Tool(
-                        name="batch_validate",
-                        description="Validate multiple outputs in batch",
-                        inputSchema={
-                            "type": "object",
-                            "properties": {
-                                "outputs": {
-                                    "type": "array",
-                                    "items": {"type": "string"},
-                                    "description": "List of AI-generated contents to validate"
-                                },
-                                "validation_type": {
-                                    "type": "string",
-                                    "enum": ["quick", "comprehensive", "factual", "logical", "sources"],
-                                    "default": "comprehensive",
-                                    "description": "Type of validation to perform"
-                                }
+                            "format": {
+                                "type": "string",
+                                "enum": ["pretty", "json"],
+                                "default": "pretty",
+                                "description": "Response format"
+                            }
+                        },
+                        "required": ["output"]
+                    }
+                ),
+                Tool(
+                    name="quick_check",
+                    description="Quick validation check - returns true/false",
+                    inputSchema={
+                        "type": "object",
+                        "properties": {
+                            "output": {
+                                "type": "string",
+                                "description": "The AI-generated content to check"
+                            }
+                        },
+                        "required": ["output"]
+                    }
+                ),
+                Tool(
+                    name="get_confidence_score",
+                    description="Get confidence score for an output (0.0 to 1.0)",
+                    inputSchema={
+                        "type": "object",
+                        "properties": {
+                            "output": {
+                                "type": "string",
+                                "description": "The AI-generated content to score"
+                            }
+                        },
+                        "required": ["output"]
+                    }
+                ),
+                Tool(
+                    name="batch_validate",
+                    description="Validate multiple outputs in batch",
+                    inputSchema={
+                        "type": "object",
+                        "properties": {
+                            "outputs": {
+                                "type": "array",
+                                "items": {"type": "string"},
+                                "description": "List of AI-generated contents to validate"
                             },
-                            "required": ["outputs"]
-                        }
-                    )
-                ]
-            )
-        
+                            "validation_type": {
+                                "type": "string",
+                                "enum": ["quick", "comprehensive", "factual", "logical", "sources"],
+                                "default": "comprehensive",
+                                "description": "Type of validation to perform"
+                            },
+                            "format": {
+                                "type": "string",
+                                "enum": ["pretty", "toon", "json"],
+                                "default": "pretty",
+                                "description": "Response format; 'toon' is a compact tabular form for LLM consumers"
+                            }
+                        },
+                        "required": ["outputs"]
+                    }
+                )
+            ]
+        )
+
+    def _setup_handlers(self):
+        """Set up MCP request handlers using low-level API."""
+
+        async def handle_list_tools(request: ListToolsRequest) -> ListToolsResult:
+            """List available validation tools."""
+            return self._tools_result
+
         async def handle_call_tool(request: CallToolRequest) -> CallToolResult:
             """Handle tool calls."""
             try:
                 name = request.params.name
                 arguments = request.params.arguments or {}
-                
-                if name == "validate_output":
-                    return await self._handle_validate_output(arguments)
-                elif name == "quick_check":
-                    return await self._handle_quick_check(arguments)
-                elif name == "get_confidence_score":
-                    return await self._handle_get_confidence_score(arguments)
-                elif name == "batch_validate":
-                    return await self._handle_batch_validate(arguments)
-                else:
-                    return CallToolResult(
-                        content=[TextContent(type="text", text=f"Unknown tool: {name}")],
-                        isError=True
-                    )
+
+                if self._limiter is None:
+                    self._limiter = anyio.CapacityLimiter(self._max_inflight)
+
+                async with self._limiter:
+                    if name == "validate_output":
+                        return await self._handle_validate_output(arguments)
+                    elif name == "quick_check":
+                        return await self._handle_quick_check(arguments)
+                    elif name == "get_confidence_score":
+                        return await self._handle_get_confidence_score(arguments)
+                    elif name == "batch_validate":
+                        return await self._handle_batch_validate(arguments)
+
+                return CallToolResult(
+                    content=[TextContent(type="text", text=f"Unknown tool: {name}")],
+                    isError=True
+                )
             except Exception as e:
                 return CallToolResult(
                     content=[TextContent(type="text", text=f"Error: {str(e)}")],
@@ -164,16 +370,35 @@ class LithiumMCPServer:
         validation_type = arguments.get("validation_type", "comprehensive")
         
         if not output:
-            return CallToolResult(
-                content=[TextContent(type="text", text="Error: No output provided")],
-                isError=True
-            )
-        
-        result = self.validator.validate_output(output, context, validation_type)
+            return self._empty_output_err
         
+        key = self._cache_key("validate_output", validation_type, output, context)
+        result = self._cache.get(key)
+        use_disk = self._dcache is not None and validation_type == "comprehensive"
+        if result is None and use_disk:
+            # diskcache hits sqlite synchronously; keep it off the loop
+            stored = await asyncio.to_thread(
+                self._dcache.get, self._disk_key(validation_type, context, output))
+            if stored is not None:
+                result = ValidationResult.from_dict(json.loads(stored))
+                self._cache.set(key, result)
+        if result is None:
+            result = await self._invoke(
+                self.validator.validate_output, output, context, validation_type)
+            self._cache.set(key, result)
+            if use_disk:
+                await asyncio.to_thread(
+                    self._dcache.set,
+                    self._disk_key(validation_type, context, output),
+                    _json_encode(result.to_dict()),
+                    expire=86400 * 7)
+
         # Format result for display
-        result_text = self._format_validation_result(result)
-        
+        if arguments.get("format") == "json":
+            result_text = _json_encode(result.to_dict())
+        else:
+            result_text = self._format_validation_result(result)
+
         return CallToolResult(
             content=[TextContent(type="text", text=result_text)]
         )
@@ -183,12 +408,13 @@ class LithiumMCPServer:
         output = arguments.get("output", "")
         
         if not output:
-            return CallToolResult(
-                content=[TextContent(type="text", text="Error: No output provided")],
-                isError=True
-            )
+            return self._empty_output_err
         
-        is_valid = self.validator.quick_check(output)
+        key = self._cache_key("quick_check", None, output)
+        is_valid = self._cache.get(key)
+        if is_valid is None:
+            is_valid = await self._invoke(self.validator.quick_check, output)
+            self._cache.set(key, is_valid)
         result_text = f"Quick validation result: {'✅ Valid' if is_valid else '❌ Invalid'}"
         
         return CallToolResult(
@@ -200,12 +426,13 @@ class LithiumMCPServer:
         output = arguments.get("output", "")
         
         if not output:
-            return CallToolResult(
-                content=[TextContent(type="text", text="Error: No output provided")],
-                isError=True
-            )
+            return self._empty_output_err
         
-        score = self.validator.get_confidence_score(output)
+        key = self._cache_key("get_confidence_score", None, output)
+        score = self._cache.get(key)
+        if score is None:
+            score = await self._invoke(self.validator.get_confidence_score, output)
+            self._cache.set(key, score)
         result_text = f"Confidence score: {score:.2f} ({self._get_confidence_level(score)})"
         
         return CallToolResult(
@@ -213,71 +440,131 @@ class LithiumMCPServer:
         )
     
     async def _handle_batch_validate(self, arguments: Dict[str, Any]) -> CallToolResult:
-        """Handle batch_validate tool call."""
+        """Handle batch_validate tool call.
+
+        MCP call_tool responses cannot stream, so the handler collects
+        all results before replying; items still validate concurrently
+        via the task group, and incremental consumers can use
+        ValidationInterface.iter_validate directly.
+        """
         outputs = arguments.get("outputs", [])
         validation_type = arguments.get("validation_type", "comprehensive")
         
         if not outputs:
-            return CallToolResult(
-                content=[TextContent(type="text", text="Error: No outputs provided")],
-                isError=True
-            )
-        
-        results = self.validator.batch_validate(outputs, validation_type)
-        
-        # Format batch results
-        result_text = "🔬 Batch Validation Results\n"
-        result_text += "=" * 40 + "\n\n"
-        
-        for i, result in enumerate(results, 1):
-            result_text += f"📝 Output {i}:\n"
-            result_text += f"  ✅ Valid: {'Yes' if result.is_valid else 'No'}\n"
-            result_text += f"  🎯 Confidence: {result.confidence.value.upper()}\n"
-            result_text += f"  📊 Score: {result.score:.2f}\n"
-            if result.warnings:
-                result_text += f"  ⚠️  Warnings: {len(result.warnings)}\n"
-            result_text += "\n"
+            return self._empty_batch_err
         
-        return CallToolResult(
-            content=[TextContent(type="text", text=result_text)]
+        # Fan the batch out across worker threads; gather preserves input
+        # order and the semaphore bounds concurrency
+        async def validate_one(output: str) -> ValidationResult:
+            async with self._semaphore:
+                return await self._invoke(
+                    self.validator.validate_output, output, None, validation_type)
+
+        # Serve cache hits directly and only validate the misses; single
+        # and batch calls share keys, so repeats hit across both paths.
+        # Misses are deduplicated so each distinct output is validated
+        # once and the result scattered back to every position
+        results: List[Optional[ValidationResult]] = [None] * len(outputs)
+        miss_positions: Dict[str, List[int]] = {}
+        for i, output in enumerate(outputs):
+            cached = self._cache.get(
+                self._cache_key("validate_output", validation_type, output))
+            if cached is not None:
+                results[i] = cached
+            else:
+                miss_positions.setdefault(output, []).append(i)
+
+        if miss_positions:
+            async def run_one(output: str, positions: List[int]) -> None:
+                result = await validate_one(output)
+                for i in positions:
+                    results[i] = result
+                self._cache.set(
+                    self._cache_key("validate_output", validation_type, output),
+                    result)
+
+            async with anyio.create_task_group() as tg:
+                for output, positions in miss_positions.items():
+                    tg.start_soon(run_one, output, positions)
+
+        fmt = arguments.get("format", "pretty")
+        if fmt == "json":
+            return CallToolResult(content=[TextContent(
+                type="text",
+                text=_json_encode([result.to_dict() for result in results]))])
+        if fmt == "toon":
+            return CallToolResult(content=[TextContent(
+                type="text", text=self._format_batch_toon(results))])
+
+        # One content entry per item keeps memory proportional to the
+        # largest single result rather than the whole report
+        contents = [TextContent(type="text", text=_HEADER_BATCH)]
+        contents.extend(
+            TextContent(type="text", text=self._format_batch_item(i, result))
+            for i, result in enumerate(results, 1)
+        )
+
+        return CallToolResult(content=contents)
+
+    @staticmethod
+    def _format_batch_toon(results: List[ValidationResult]) -> str:
+        """Format batch results as compact TOON-style rows.
+
+        One header line declaring the fields, then one comma-separated
+        row per result; a fraction of the tokens the pretty form costs.
+        """
+        parts = [f"results[{len(results)}]{{idx,valid,confidence,score,warnings}}:\n"]
+        parts.extend(
+            f"  {i},{str(result.is_valid).lower()},{result.confidence.value},"
+            f"{result.score:.2f},{len(result.warnings)}\n"
+            for i, result in enumerate(results, 1)
         )
+        return "".join(parts)
+
+    @staticmethod
+    def _format_batch_item(i: int, result: ValidationResult) -> str:
+        """Format one batch entry as its own content fragment."""
+        parts = [f"📝 Output {i}:\n"]
+        parts.append(_ITEM_VALID_YES if result.is_valid else _ITEM_VALID_NO)
+        parts.append(f"  🎯 Confidence: {result.confidence.value.upper()}\n")
+        parts.append(f"  📊 Score: {result.score:.2f}\n")
+        if result.warnings:
+            parts.append(f"  ⚠️  Warnings: {len(result.warnings)}\n")
+        return "".join(parts)
     
     def _format_validation_result(self, result: ValidationResult) -> str:
         """Format validation result for display."""
-        text = "🔬 Lithium-Validation Results\n"
-        text += "=" * 40 + "\n"
-        text += f"✅ Valid: {'Yes' if result.is_valid else 'No'}\n"
-        text += f"🎯 Confidence: {result.confidence.value.upper()}\n"
-        text += f"📊 Score: {result.score:.2f}\n"
-        text += f"⏰ Timestamp: {result.timestamp.strftime('%Y-%m-%d %H:%M:%S')}\n"
-        
+        parts = [_HEADER_SINGLE]
+        parts.append(_VALID_YES if result.is_valid else _VALID_NO)
+        parts.append(f"🎯 Confidence: {result.confidence.value.upper()}\n")
+        parts.append(f"📊 Score: {result.score:.2f}\n")
+        parts.append(f"⏰ Timestamp: {result.timestamp.isoformat(' ', 'seconds')}\n")
+
         if result.details:
-            text += "\n📈 Detailed Analysis:\n"
-            for category, details in result.details.items():
-                text += f"  • {category.replace('_', ' ').title()}: {details['score']:.2f}\n"
-        
+            parts.append(_DETAILS_HEADER)
+            parts.extend(
+                f"  • {_pretty(category)}: {details['score']:.2f}\n"
+                for category, details in result.details.items()
+            )
+
         if result.warnings:
-            text += f"\n⚠️  Warnings ({len(result.warnings)}):\n"
+            parts.append(f"\n⚠️  Warnings ({len(result.warnings)}):\n")
             for i, warning in enumerate(result.warnings, 1):
-                text += f"  {i}. {warning}\n"
+                parts.append(f"  {i}. {warning}\n")
         else:
-            text += "\n✅ No warnings found\n"
-        
-        return text
-    
+            parts.append(_NO_WARNINGS)
+
+        return "".join(parts)
+
     def _get_confidence_level(self, score: float) -> str:
         """Get confidence level string from score."""
-        if score >= 0.9:
-            return "HIGH"
-        elif score >= 0.7:
-            return "MEDIUM"
-        elif score >= 0.5:
-            return "LOW"
-        else:
-            return "INSUFFICIENT"
+        return _CONFIDENCE_LABELS[bisect.bisect_right(_CONFIDENCE_BOUNDS, score)]
     
     async def run(self):
         """Run the MCP server."""
+        # The stdio transport frames each JSON-RPC message as a single
+        # newline-delimited write, so responses already reach the pipe
+        # in one syscall; no extra buffering layer is needed here.
         async with stdio_server() as (read_stream, write_stream):
             await self.server.run(
                 read_stream,
@@ -295,6 +582,14 @@ class LithiumMCPServer:
 
 def main():
     """Main entry point for MCP server."""
+    # uvloop roughly doubles async I/O throughput when installed; set
+    # LITHIUM_UVLOOP=0 to stay on the stock loop for debugging
+    if os.environ.get("LITHIUM_UVLOOP") != "0":
+        try:
+            import uvloop
+            asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+        except ImportError:
+            pass
     server = LithiumMCPServer()
     asyncio.run(server.run())
 
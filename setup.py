@@ -1,31 +1,50 @@
-from setuptools import setup, find_packages
+"""Extension build hooks; all project metadata lives in pyproject.toml."""
 
-with open("README.md", "r", encoding="utf-8") as fh:
-    long_description = fh.read()
+import os
 
-setup(
-    name="Lithium-Validation",
-    version="1.0.0",
-    author="Guillermo Espinosa",
-    author_email="hola@ged.do",
-    description="AI output validation framework based on hallucination research",
-    long_description=long_description,
-    long_description_content_type="text/markdown",
-    url="https://github.com/GED-DO/Lithium-Validation",
-    packages=find_packages(),
-    classifiers=[
-        "Development Status :: 4 - Beta",
-        "Intended Audience :: Developers",
-        "Topic :: Scientific/Engineering :: Artificial Intelligence",
-        "License :: OSI Approved :: MIT License",
-        "Programming Language :: Python :: 3",
-        "Programming Language :: Python :: 3.8",
-    ],
-    python_requires=">=3.8",
-    install_requires=["mcp>=1.0.0"],
-    entry_points={
-        "console_scripts": [
-            "lithium-validate=lithium_validation.cli.validate:main",
-        ],
-    },
-)
+from setuptools import setup
+
+# Optionally compile the scoring kernel ahead of time with mypyc. The
+# kernel lives in its own cleanly typed module because the full engine
+# module (optional-import fallbacks, dynamic njit rebinding, dataclass
+# slots) does not type-check under mypyc. Opt-in via LITHIUM_AOT=1 so
+# plain installs never require a C toolchain; the pure-Python module is
+# used whenever the extension is absent.
+#
+# mypy is not a declared build requirement, so AOT builds need it in the
+# build environment, e.g.:
+#     pip install mypy && LITHIUM_AOT=1 pip install --no-build-isolation .
+ext_modules = []
+if os.environ.get("LITHIUM_AOT") == "1":
+    try:
+        from mypyc.build import mypycify
+    except ImportError as exc:
+        # Fail loudly: under default build isolation mypy is absent and
+        # the opt-in flag would otherwise silently ship a pure wheel
+        raise RuntimeError(
+            "LITHIUM_AOT=1 requires mypy in the build environment; "
+            "install mypy and build with --no-build-isolation"
+        ) from exc
+    # follow-imports=skip stops mypy from following the package imports
+    # into the modules that intentionally do not type-check; only the
+    # kernel itself is checked and compiled
+    ext_modules = mypycify(
+        ["--follow-imports=skip", "lithium_validation/core/scoring.py"])
+
+# Placeholder for future compiled hot paths (tokenizers, claim scanners).
+# Opt-in via LITHIUM_RUST=1 once a crate exists under rust/.
+rust_extensions = []
+if os.environ.get("LITHIUM_RUST") == "1":
+    try:
+        from setuptools_rust import RustExtension
+        rust_extensions = [RustExtension("lithium_validation._fast")]
+    except ImportError:
+        pass
+
+# Only pass rust_extensions when setuptools-rust is actually driving the
+# build; plain setuptools warns on unknown options
+kwargs = {"ext_modules": ext_modules}
+if rust_extensions:
+    kwargs["rust_extensions"] = rust_extensions
+
+setup(**kwargs)
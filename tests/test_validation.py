@@ -10,7 +10,7 @@ from pathlib import Path
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from lithium_validation import ValidationInterface, quick_check, quick_validate
-from lithium_validation.core.validation_engine import ConfidenceLevel
+from lithium_validation.core.validation_engine import ConfidenceLevel, OutputValidator
 
 
 class TestValidationInterface(unittest.TestCase):
@@ -79,7 +79,33 @@ class TestValidationInterface(unittest.TestCase):
             result = self.interface.validate_output(output, validation_type=vtype)
             self.assertEqual(result.validation_type, vtype)
             self.assertIsInstance(result.is_valid, bool)
+
+    def test_validation_types_run_matching_checks(self):
+        """Test that focused validation types only run their own check."""
+        output = "According to studies, cats are mammals."
+
+        factual = self.interface.validate_output(output, validation_type="factual")
+        self.assertEqual(list(factual.details), ["factual_validation"])
+
+        quick = self.interface.validate_output(output, validation_type="quick")
+        self.assertNotIn("logical_consistency", quick.details)
     
+    def test_warning_limit(self):
+        """Test that warnings beyond the cap collapse into a summary line."""
+        interface = ValidationInterface({"max_warnings": 2})
+        output = "According to studies, research indicates and data suggests things."
+        result = interface.validate_output(output)
+
+        self.assertEqual(len(result.warnings), 3)
+        self.assertEqual(result.warnings[-1], "... and 1 more warnings")
+
+    def test_repeated_validation_is_cached(self):
+        """Test that validating the same output twice reuses the result."""
+        output = "The sun rises in the east."
+        first = self.interface.validate_output(output)
+        second = self.interface.validate_output(output)
+        self.assertIs(first, second)
+
     def test_custom_configuration(self):
         """Test custom configuration."""
         config = {
@@ -100,7 +126,6 @@ class TestValidationEngine(unittest.TestCase):
     
     def setUp(self):
         """Set up test fixtures."""
-        from lithium_validation.core.validation_engine import OutputValidator
         self.validator = OutputValidator()
     
     def test_factual_validation(self):